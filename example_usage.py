@@ -7,9 +7,13 @@ This script demonstrates how to use the SO101Controller class programmatically
 without keyboard input. Useful for automated sequences or custom control logic.
 """
 
-import time
 from so101_keyboard_control import SO101Controller
 
+def move_and_wait(robot, positions, timeout):
+    """Move motors and wait until they arrive, for at most timeout seconds"""
+    robot.move_motors(positions)
+    robot.wait_for_positions(positions, timeout=timeout)
+
 def demo_sequence(robot):
     """Demonstrate a simple movement sequence"""
     print("Starting demo sequence...")
@@ -20,51 +24,34 @@ def demo_sequence(robot):
 
     # Move shoulder pan left and right
     print("Moving shoulder pan...")
-    robot.move_motor("shoulder_pan", -30)
-    time.sleep(2)
-    robot.move_motor("shoulder_pan", 30)
-    time.sleep(2)
-    robot.move_motor("shoulder_pan", 0)
-    time.sleep(1)
+    move_and_wait(robot, {"shoulder_pan": -30}, timeout=2)
+    move_and_wait(robot, {"shoulder_pan": 30}, timeout=2)
+    move_and_wait(robot, {"shoulder_pan": 0}, timeout=1)
 
     # Move shoulder lift up and down
     print("Moving shoulder lift...")
-    robot.move_motor("shoulder_lift", 20)
-    time.sleep(2)
-    robot.move_motor("shoulder_lift", -20)
-    time.sleep(2)
-    robot.move_motor("shoulder_lift", 0)
-    time.sleep(1)
+    move_and_wait(robot, {"shoulder_lift": 20}, timeout=2)
+    move_and_wait(robot, {"shoulder_lift": -20}, timeout=2)
+    move_and_wait(robot, {"shoulder_lift": 0}, timeout=1)
 
     # Move elbow
     print("Moving elbow...")
-    robot.move_motor("elbow_flex", 45)
-    time.sleep(2)
-    robot.move_motor("elbow_flex", -45)
-    time.sleep(2)
-    robot.move_motor("elbow_flex", 0)
-    time.sleep(1)
+    move_and_wait(robot, {"elbow_flex": 45}, timeout=2)
+    move_and_wait(robot, {"elbow_flex": -45}, timeout=2)
+    move_and_wait(robot, {"elbow_flex": 0}, timeout=1)
 
     # Move wrist
     print("Moving wrist...")
-    robot.move_motor("wrist_flex", 30)
-    time.sleep(1)
-    robot.move_motor("wrist_roll", 45)
-    time.sleep(1)
-    robot.move_motor("wrist_roll", -45)
-    time.sleep(1)
-    robot.move_motor("wrist_roll", 0)
-    robot.move_motor("wrist_flex", 0)
-    time.sleep(1)
+    move_and_wait(robot, {"wrist_flex": 30}, timeout=1)
+    move_and_wait(robot, {"wrist_roll": 45}, timeout=1)
+    move_and_wait(robot, {"wrist_roll": -45}, timeout=1)
+    move_and_wait(robot, {"wrist_roll": 0, "wrist_flex": 0}, timeout=1)
 
     # Move gripper
     print("Moving gripper...")
-    robot.move_motor("gripper", 50)  # Half open
-    time.sleep(1)
-    robot.move_motor("gripper", 100)  # Fully open
-    time.sleep(1)
-    robot.move_motor("gripper", 0)  # Closed
-    time.sleep(1)
+    move_and_wait(robot, {"gripper": 50}, timeout=1)  # Half open
+    move_and_wait(robot, {"gripper": 100}, timeout=1)  # Fully open
+    move_and_wait(robot, {"gripper": 0}, timeout=1)  # Closed
 
     print("Demo sequence completed!")
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+USB-Serial Low-Latency Helper
+=============================
+
+Shared by so101_keyboard_control.py and test_connection.py. Only depends on the
+standard library, so it can be imported without pynput.
+"""
+
+import array
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+# serial_struct.flags bit that asks the driver to push received bytes immediately
+ASYNC_LOW_LATENCY = 0x2000
+
+# Index of the flags field in struct serial_struct, read as an array of ints
+SERIAL_STRUCT_FLAGS = 4
+
+
+def set_low_latency(port_handler) -> bool:
+    """Put the USB-serial adapter behind port_handler into low-latency mode (Linux only), True if applied"""
+    # Linux drivers hold received bytes for up to latency_timer ms (16 by default),
+    # which dominates every TxRx round-trip; other platforms are left untouched
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+    import termios
+
+    applied = False
+
+    # FTDI-style adapters expose the latency timer through sysfs (needs write access)
+    device = os.path.basename(os.path.realpath(port_handler.getPortName()))
+    latency_timer = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+    try:
+        with open(latency_timer, "w") as f:
+            f.write("1")
+        applied = True
+    except OSError as e:
+        logger.debug("Could not set %s: %s", latency_timer, e)
+
+    # Same request through the serial driver, as done by DynamixelSDK
+    try:
+        fd = port_handler.ser.fileno()
+        buf = array.array('i', [0] * 32)
+        fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+        buf[SERIAL_STRUCT_FLAGS] |= ASYNC_LOW_LATENCY
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        applied = True
+    except (AttributeError, OSError) as e:
+        logger.debug("Could not enable ASYNC_LOW_LATENCY on %s: %s", port_handler.getPortName(), e)
+
+    return applied
@@ -20,15 +20,18 @@ Requirements:
 
 Usage:
     python so101_keyboard_control.py --port /dev/ttyUSB0
+    python so101_keyboard_control.py --port /dev/ttyUSB0 --verbose  # log every motor command
 """
 
 import argparse
 import logging
+import os
+import selectors
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from queue import Queue
 import threading
 
@@ -45,11 +48,49 @@ except ImportError:
     print("ERROR: pynput not installed. Install with: pip install pynput")
     sys.exit(1)
 
+from low_latency import set_low_latency
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class SelectorPortHandler(scs.PortHandler):
+    """PortHandler that sleeps until reply bytes arrive instead of busy-polling the port"""
+
+    def __init__(self, port_name):
+        super().__init__(port_name)
+        self._selector = None
+
+    def setupPort(self, cflag_baud):
+        result = super().setupPort(cflag_baud)
+        # select() is what pyserial uses for ttys; kqueue is unreliable for them on macOS.
+        # Without a selector (Windows, or register fails) this is the stock busy-poll.
+        if os.name == "posix":
+            selector = selectors.SelectSelector()
+            try:
+                selector.register(self.ser.fileno(), selectors.EVENT_READ)
+                self._selector = selector
+            except (OSError, ValueError) as e:
+                selector.close()
+                logger.debug("Cannot wait on %s, falling back to polling: %s", self.port_name, e)
+        return result
+
+    def closePort(self):
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        super().closePort()
+
+    def readPort(self, length):
+        # The stock handler spins on a non-blocking read; wait up to the remaining packet timeout instead
+        if self._selector is not None and length > 0 and not self.ser.in_waiting:
+            remaining_ms = self.packet_timeout - self.getTimeSinceStart()
+            if remaining_ms > 0:
+                self._selector.select(timeout=remaining_ms / 1000.0)
+        return super().readPort(length)
+
+
 class OperatingMode(Enum):
     POSITION = 0
     VELOCITY = 1
@@ -57,6 +98,24 @@ class OperatingMode(Enum):
     STEP = 3
 
 
+# Motor units (0-4095) per degree and per percent of gripper opening
+DEG_TO_UNITS = 4095.0 / 360.0
+GRIPPER_TO_UNITS = 4095.0 / 100.0
+
+
+def degrees_to_motor_units(degrees: float) -> int:
+    """Convert degrees to motor units (0-4095)"""
+    # Map -180 to 180 degrees to 0-4095 motor units
+    motor_units = int((degrees + 180.0) * DEG_TO_UNITS)
+    return 0 if motor_units < 0 else (4095 if motor_units > 4095 else motor_units)
+
+
+def gripper_to_motor_units(percent: float) -> int:
+    """Convert gripper opening (0-100) to motor units (0-4095)"""
+    motor_units = int(percent * GRIPPER_TO_UNITS)
+    return 0 if motor_units < 0 else (4095 if motor_units > 4095 else motor_units)
+
+
 @dataclass
 class Motor:
     id: int
@@ -64,6 +123,8 @@ class Motor:
     position: float = 0.0
     min_pos: float = -180.0
     max_pos: float = 180.0
+    # Converts a clamped position to motor units, chosen once per motor
+    to_units: Callable[[float], int] = field(default=degrees_to_motor_units, repr=False)
 
 
 class SO101Controller:
@@ -76,7 +137,7 @@ class SO101Controller:
         "elbow_flex": Motor(3, "sts3215"),
         "wrist_flex": Motor(4, "sts3215"),
         "wrist_roll": Motor(5, "sts3215"),
-        "gripper": Motor(6, "sts3215", min_pos=0.0, max_pos=100.0),
+        "gripper": Motor(6, "sts3215", min_pos=0.0, max_pos=100.0, to_units=gripper_to_motor_units),
     }
 
     # Control table addresses for STS3215
@@ -84,21 +145,53 @@ class SO101Controller:
     ADDR_GOAL_POSITION = 42
     ADDR_PRESENT_POSITION = 56
     ADDR_OPERATING_MODE = 33
+    ADDR_MODEL_NUMBER = 3
+
+    _COMM_SUCCESS = scs.COMM_SUCCESS
+
+    # Goals closer than _POS_EPS to the last one sent within _MIN_DT seconds are dropped
+    _POS_EPS = 1.0
+    _MIN_DT = 0.02
 
     def __init__(self, port: str, baudrate: int = 1000000):
         self.port = port
         self.baudrate = baudrate
         self.port_handler = None
         self.packet_handler = None
+        self.group_sync_write = None
+        self.group_sync_read = None
         self.connected = False
 
+        # Bound SDK methods, cached in connect() for the per-motor helpers
+        self._ph = None
+        self._w2 = None
+        self._r2 = None
+
+        # Last goal sent per motor as (position, perf_counter timestamp)
+        self._last_sent = {name: (0.0, 0.0) for name in self.MOTORS}
+
     def connect(self):
         """Connect to the robot arm"""
         try:
-            logger.info(f"Attempting to connect to {self.port} at {self.baudrate} baud")
-            self.port_handler = scs.PortHandler(self.port)
+            logger.info("Attempting to connect to %s at %s baud", self.port, self.baudrate)
+            self.port_handler = SelectorPortHandler(self.port)
             self.packet_handler = scs.PacketHandler(0)  # Protocol version 0
 
+            # Skip the attribute lookups on every register access
+            self._ph = self.port_handler
+            self._w2 = self.packet_handler.write2ByteTxRx
+            self._r2 = self.packet_handler.read2ByteTxRx
+
+            # Group handlers pack all motor IDs into a single packet (one round-trip instead of six)
+            self.group_sync_write = scs.GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.ADDR_GOAL_POSITION, 2
+            )
+            self.group_sync_read = scs.GroupSyncRead(
+                self.port_handler, self.packet_handler, self.ADDR_PRESENT_POSITION, 2
+            )
+            for motor in self.MOTORS.values():
+                self.group_sync_read.addParam(motor.id)
+
             logger.debug("Opening port...")
             if not self.port_handler.openPort():
                 raise Exception(f"Failed to open port {self.port}")
@@ -107,6 +200,10 @@ class SO101Controller:
             if not self.port_handler.setBaudRate(self.baudrate):
                 raise Exception(f"Failed to set baudrate to {self.baudrate}")
 
+            logger.debug("Enabling low-latency mode...")
+            if not set_low_latency(self.port_handler):
+                logger.debug("Low-latency mode not available, using driver defaults")
+
             logger.debug("Testing connection by pinging motors...")
             # Test connection by pinging motors
             self._ping_motors()
@@ -116,11 +213,16 @@ class SO101Controller:
             self._configure_motors()
 
             self.connected = True
-            logger.info(f"Successfully connected to SO101 robot on {self.port}")
+            logger.info("Successfully connected to SO101 robot on %s", self.port)
 
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
-            self.disconnect()
+            logger.error("Failed to connect: %s", e)
+            # disconnect() only acts once connected, so release a port left open by a partial attempt
+            if self.port_handler and self.port_handler.is_open:
+                try:
+                    self.port_handler.closePort()
+                except Exception as close_error:
+                    logger.warning("Error closing port after failed connect: %s", close_error)
             raise
 
     def disconnect(self):
@@ -129,99 +231,186 @@ class SO101Controller:
             try:
                 self.disable_torque()
             except Exception as e:
-                logger.warning(f"Error disabling torque during disconnect: {e}")
+                logger.warning("Error disabling torque during disconnect: %s", e)
 
             try:
                 self.port_handler.closePort()
             except Exception as e:
-                logger.warning(f"Error closing port during disconnect: {e}")
+                logger.warning("Error closing port during disconnect: %s", e)
 
             self.connected = False
             logger.info("Disconnected from SO101 robot")
 
+    def _broadcast_ping(self) -> set:
+        """Ping every motor with one broadcast packet and return the IDs that replied"""
+        # scservo_sdk has no broadcastPing(), so send the packet and collect status replies by hand
+        status_length = 6  # HEADER0 HEADER1 ID LENGTH ERROR CHECKSUM
+        wait_length = status_length * len(self.MOTORS)
+
+        txpacket = [0] * 6
+        txpacket[scs.PKT_ID] = scs.BROADCAST_ID
+        txpacket[scs.PKT_LENGTH] = 2
+        txpacket[scs.PKT_INSTRUCTION] = scs.INST_PING
+        result = self.packet_handler.txPacket(self.port_handler, txpacket)
+        if result != self._COMM_SUCCESS:
+            self.port_handler.is_using = False
+            logger.debug("Broadcast ping failed: %s", self.packet_handler.getTxRxResult(result))
+            return set()
+
+        tx_time_per_byte = (1000.0 / self.port_handler.getBaudRate()) * 10.0
+        # Allow ~3 ms per replying motor plus the USB latency timer, sized for our motors rather than a full ID scan
+        self.port_handler.setPacketTimeoutMillis(
+            (wait_length * tx_time_per_byte) + (3.0 * len(self.MOTORS)) + scs.LATENCY_TIMER
+        )
+
+        rxpacket = []
+        while len(rxpacket) < wait_length and not self.port_handler.isPacketTimeout():
+            rxpacket.extend(self.port_handler.readPort(wait_length - len(rxpacket)))
+        self.port_handler.is_using = False
+
+        # Pick out every well-formed status packet
+        found = set()
+        idx = 0
+        while idx + status_length <= len(rxpacket):
+            packet = rxpacket[idx: idx + status_length]
+            if packet[0] == 0xFF and packet[1] == 0xFF and packet[5] == (~sum(packet[2:5]) & 0xFF):
+                found.add(packet[2])
+                idx += status_length
+            else:
+                idx += 1
+        return found
+
     def _ping_motors(self):
         """Ping all motors to check connection"""
+        found = self._broadcast_ping()
+
+        # Retry motors missing from the broadcast reply one at a time, for a precise error
         for name, motor in self.MOTORS.items():
+            if motor.id in found:
+                continue
             model_number, result, error = self.packet_handler.ping(self.port_handler, motor.id)
-            if result != scs.COMM_SUCCESS:
+            if result != self._COMM_SUCCESS:
                 raise Exception(f"Failed to ping motor {name} (ID: {motor.id}): {self.packet_handler.getTxRxResult(result)}")
-            logger.debug(f"Motor {name} (ID: {motor.id}) found, model: {model_number}")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Model numbers for all motors in one sync read
+            group_sync_read = scs.GroupSyncRead(self.port_handler, self.packet_handler, self.ADDR_MODEL_NUMBER, 2)
+            for motor in self.MOTORS.values():
+                group_sync_read.addParam(motor.id)
+            group_sync_read.txRxPacket()
+            for name, motor in self.MOTORS.items():
+                logger.debug("Motor %s (ID: %s) found, model: %s", name, motor.id, group_sync_read.getData(motor.id, self.ADDR_MODEL_NUMBER, 2))
 
     def _configure_motors(self):
         """Configure motors for position control"""
-        for name, motor in self.MOTORS.items():
-            # Set operating mode to position control
-            self._write_byte(motor.id, self.ADDR_OPERATING_MODE, OperatingMode.POSITION.value)
+        # Set operating mode to position control
+        self._sync_write_byte(self.ADDR_OPERATING_MODE, OperatingMode.POSITION.value)
 
-            # Enable torque
-            self._write_byte(motor.id, self.ADDR_TORQUE_ENABLE, 1)
+        # Enable torque
+        self.enable_torque()
 
-            # Read current position
-            motor.position = self._read_position(motor.id)
+        # Read current positions in a single round-trip
+        for name, position in self.get_positions().items():
+            self.MOTORS[name].position = position
 
         logger.info("Motors configured for position control")
 
     def enable_torque(self):
         """Enable torque for all motors"""
-        for motor in self.MOTORS.values():
-            self._write_byte(motor.id, self.ADDR_TORQUE_ENABLE, 1)
+        self._broadcast_write_byte(self.ADDR_TORQUE_ENABLE, 1)
 
     def disable_torque(self):
         """Disable torque for all motors"""
         if not self.connected:
             return
 
-        for name, motor in self.MOTORS.items():
-            try:
-                self._write_byte(motor.id, self.ADDR_TORQUE_ENABLE, 0)
-                logger.debug(f"Disabled torque for {name}")
-            except Exception as e:
-                logger.warning(f"Failed to disable torque for {name}: {e}")
+        # The broadcast gets no reply, so read the torque register back to confirm it
+        self._broadcast_write_byte(self.ADDR_TORQUE_ENABLE, 0)
+        try:
+            remaining = self._motors_with_torque()
+            if remaining:
+                logger.warning("Torque disable not confirmed for %s, resending", ", ".join(remaining))
+                self._sync_write_byte(self.ADDR_TORQUE_ENABLE, 0, [self.MOTORS[name].id for name in remaining])
+                remaining = self._motors_with_torque()
+        except Exception as e:
+            # Runs on the emergency-stop path, so never let a serial fault escape
+            self.port_handler.is_using = False
+            logger.warning("Could not confirm torque disable: %s", e)
+            return
+
+        if remaining:
+            logger.warning("Failed to disable torque for %s", ", ".join(remaining))
+        else:
+            logger.debug("Disabled torque for all motors")
 
-    def _write_byte(self, motor_id: int, address: int, value: int):
-        """Write a byte to motor register"""
+    def _motors_with_torque(self) -> List[str]:
+        """Names of motors whose torque is not confirmed off (still enabled or unreadable)"""
+        group_sync_read = scs.GroupSyncRead(self.port_handler, self.packet_handler, self.ADDR_TORQUE_ENABLE, 1)
+        for motor in self.MOTORS.values():
+            group_sync_read.addParam(motor.id)
+
+        self._discard_stale_input()
+        group_sync_read.txRxPacket()
+        return [
+            name for name, motor in self.MOTORS.items()
+            if not group_sync_read.isAvailable(motor.id, self.ADDR_TORQUE_ENABLE, 1)
+            or group_sync_read.getData(motor.id, self.ADDR_TORQUE_ENABLE, 1) != 0
+        ]
+
+    def _broadcast_write_byte(self, address: int, value: int):
+        """Write a byte to a register on all motors with one broadcast packet"""
         try:
-            result, error = self.packet_handler.write1ByteTxRx(
-                self.port_handler, motor_id, address, value
-            )
-            if result != scs.COMM_SUCCESS:
-                logger.warning(f"Write byte failed for motor {motor_id}: {self.packet_handler.getTxRxResult(result)}")
+            result = self.packet_handler.write1ByteTxOnly(self.port_handler, scs.BROADCAST_ID, address, value)
+            if result != self._COMM_SUCCESS:
+                logger.warning("Broadcast write failed at address %s: %s", address, self.packet_handler.getTxRxResult(result))
         except Exception as e:
-            logger.warning(f"Exception writing byte to motor {motor_id}: {e}")
+            self.port_handler.is_using = False
+            logger.warning("Exception broadcasting to address %s: %s", address, e)
+
+    def _sync_write_byte(self, address: int, value: int, motor_ids: Optional[List[int]] = None):
+        """Write the same byte to a register on several motors (default: all) with one Sync Write packet"""
+        if motor_ids is None:
+            motor_ids = [motor.id for motor in self.MOTORS.values()]
+
+        group_sync_write = scs.GroupSyncWrite(self.port_handler, self.packet_handler, address, 1)
+        for motor_id in motor_ids:
+            group_sync_write.addParam(motor_id, [value])
+
+        result = group_sync_write.txPacket()
+        if result != self._COMM_SUCCESS:
+            logger.warning("Sync write byte failed at address %s: %s", address, self.packet_handler.getTxRxResult(result))
 
     def _write_word(self, motor_id: int, address: int, value: int):
         """Write a word (2 bytes) to motor register"""
         try:
-            result, error = self.packet_handler.write2ByteTxRx(
-                self.port_handler, motor_id, address, value
-            )
-            if result != scs.COMM_SUCCESS:
-                logger.warning(f"Write word failed for motor {motor_id}: {self.packet_handler.getTxRxResult(result)}")
+            result, error = self._w2(self._ph, motor_id, address, value)
+            if result != self._COMM_SUCCESS:
+                logger.warning("Write word failed for motor %s: %s", motor_id, self.packet_handler.getTxRxResult(result))
         except Exception as e:
-            logger.warning(f"Exception writing word to motor {motor_id}: {e}")
+            logger.warning("Exception writing word to motor %s: %s", motor_id, e)
+
+    def _discard_stale_input(self):
+        """Drop unread bytes so the next reply is not parsed from an earlier command's leftovers"""
+        # PortHandler.clearPort() only flushes output, so reset the pyserial input buffer directly
+        ser = getattr(self.port_handler, "ser", None)
+        if ser is not None and ser.in_waiting:
+            ser.reset_input_buffer()
 
     def _read_position(self, motor_id: int) -> float:
         """Read current position from motor"""
-        position_value, result, error = self.packet_handler.read2ByteTxRx(
-            self.port_handler, motor_id, self.ADDR_PRESENT_POSITION
-        )
-        if result != scs.COMM_SUCCESS:
-            logger.warning(f"Read failed for motor {motor_id}: {self.packet_handler.getTxRxResult(result)}")
+        self._discard_stale_input()
+        position_value, result, error = self._r2(self._ph, motor_id, self.ADDR_PRESENT_POSITION)
+        if result != self._COMM_SUCCESS:
+            logger.warning("Read failed for motor %s: %s", motor_id, self.packet_handler.getTxRxResult(result))
             return 0.0
 
         # Convert from motor units to degrees
         return self._motor_units_to_degrees(position_value)
 
-    def _degrees_to_motor_units(self, degrees: float) -> int:
-        """Convert degrees to motor units (0-4095)"""
-        # Map -180 to 180 degrees to 0-4095 motor units
-        motor_units = int((degrees + 180.0) * 4095.0 / 360.0)
-        return max(0, min(4095, motor_units))
-
     def _motor_units_to_degrees(self, motor_units: int) -> float:
         """Convert motor units to degrees"""
         # Map 0-4095 motor units to -180 to 180 degrees
-        return (motor_units * 360.0 / 4095.0) - 180.0
+        return (motor_units / DEG_TO_UNITS) - 180.0
 
     def move_motor(self, motor_name: str, position: float):
         """Move a specific motor to a position"""
@@ -230,7 +419,7 @@ class SO101Controller:
             return
 
         if motor_name not in self.MOTORS:
-            logger.warning(f"Unknown motor: {motor_name}")
+            logger.warning("Unknown motor: %s", motor_name)
             return
 
         motor = self.MOTORS[motor_name]
@@ -238,26 +427,127 @@ class SO101Controller:
         # Clamp position to motor limits
         position = max(motor.min_pos, min(motor.max_pos, position))
 
+        if self._is_redundant(motor_name, position, time.perf_counter()):
+            return
+
         # Convert to motor units
-        if motor_name == "gripper":
-            # Gripper uses 0-100 range mapped to 0-4095
-            motor_units = int(position * 4095.0 / 100.0)
-        else:
-            motor_units = self._degrees_to_motor_units(position)
+        motor_units = motor.to_units(position)
 
         # Send command
         self._write_word(motor.id, self.ADDR_GOAL_POSITION, motor_units)
         motor.position = position
+        self._last_sent[motor_name] = (position, time.perf_counter())
+
+        logger.debug("Moved %s to %.1f", motor_name, position)
+
+    def prepare_pose(self, positions: Dict[str, float]) -> Dict[str, Tuple[float, List[int]]]:
+        """Clamp and convert a pose once to {motor: (position, goal bytes)} for send_pose()"""
+        pose = {}
+        for motor_name, position in positions.items():
+            if motor_name not in self.MOTORS:
+                logger.warning("Unknown motor: %s", motor_name)
+                continue
+
+            motor = self.MOTORS[motor_name]
+
+            # Clamp position to motor limits
+            position = max(motor.min_pos, min(motor.max_pos, position))
+            motor_units = motor.to_units(position)
+
+            pose[motor_name] = (position, [scs.SCS_LOBYTE(motor_units), scs.SCS_HIBYTE(motor_units)])
+        return pose
+
+    def send_pose(self, pose: Dict[str, Tuple[float, List[int]]]):
+        """Send a pose built by prepare_pose() as a single Sync Write packet"""
+        if not self.connected:
+            logger.warning("Robot not connected")
+            return
+
+        if not pose:
+            return
+
+        self.group_sync_write.clearParam()
+        for motor_name, (_, data) in pose.items():
+            self.group_sync_write.addParam(self.MOTORS[motor_name].id, data)
 
-        logger.debug(f"Moved {motor_name} to {position:.1f}")
+        # Send command
+        try:
+            result = self.group_sync_write.txPacket()
+        except Exception as e:
+            # txPacket() marks the port busy before writing; release it so later commands can go out
+            self.port_handler.is_using = False
+            logger.warning("Exception sending sync write: %s", e)
+            return
+        if result != self._COMM_SUCCESS:
+            logger.warning("Sync write failed: %s", self.packet_handler.getTxRxResult(result))
+            return
+
+        now = time.perf_counter()
+        for motor_name, (position, _) in pose.items():
+            self.MOTORS[motor_name].position = position
+            self._last_sent[motor_name] = (position, now)
+
+        # Skip building the message entirely unless debug output is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Moved %s", ", ".join(f"{name} to {pos:.1f}" for name, (pos, _) in pose.items()))
+
+    def move_motors(self, positions: Dict[str, float]):
+        """Move several motors at once using a single Sync Write packet"""
+        if not self.connected:
+            logger.warning("Robot not connected")
+            return
+
+        pose = self.prepare_pose(positions)
+        now = time.perf_counter()
+        self.send_pose({name: target for name, target in pose.items() if not self._is_redundant(name, target[0], now)})
+
+    def _is_redundant(self, motor_name: str, position: float, now: float) -> bool:
+        """Check whether a goal is too close, in value and time, to the last one sent"""
+        last_position, last_time = self._last_sent[motor_name]
+        return abs(position - last_position) < self._POS_EPS and now - last_time < self._MIN_DT
 
     def get_positions(self) -> Dict[str, float]:
         """Get current positions of all motors"""
+        self._discard_stale_input()
+        result = self.group_sync_read.txRxPacket()
+        if result != self._COMM_SUCCESS:
+            # Fall back to reading motors one at a time
+            logger.warning("Sync read failed: %s", self.packet_handler.getTxRxResult(result))
+            return {name: self._read_position(motor.id) for name, motor in self.MOTORS.items()}
+
         positions = {}
         for name, motor in self.MOTORS.items():
-            positions[name] = self._read_position(motor.id)
+            position_value = self.group_sync_read.getData(motor.id, self.ADDR_PRESENT_POSITION, 2)
+            positions[name] = self._motor_units_to_degrees(position_value)
         return positions
 
+    def wait_for_positions(self, positions: Dict[str, float], timeout: float = 2.0, tolerance: float = 1.5) -> bool:
+        """Poll until the motors are within tolerance of positions, True if reached before timeout"""
+        # Compare in the same scale get_positions() reports, via the commanded motor units
+        expected = {}
+        for motor_name, position in positions.items():
+            if motor_name not in self.MOTORS:
+                logger.warning("Unknown motor: %s", motor_name)
+                continue
+
+            motor = self.MOTORS[motor_name]
+            position = max(motor.min_pos, min(motor.max_pos, position))
+            expected[motor_name] = self._motor_units_to_degrees(motor.to_units(position))
+
+        if not expected:
+            return True
+
+        # Back off from 20 ms to 200 ms so short moves return almost immediately
+        dt = 0.02
+        start = time.perf_counter()
+        while time.perf_counter() - start < timeout:
+            current = self.get_positions()
+            if max(abs(current[name] - target) for name, target in expected.items()) < tolerance:
+                return True
+            time.sleep(dt)
+            dt = min(dt * 1.5, 0.2)
+        return False
+
     def emergency_stop(self):
         """Emergency stop - disable all torque"""
         logger.warning("EMERGENCY STOP!")
@@ -272,6 +562,16 @@ class KeyboardController:
         self.key_queue = Queue()
         self.running = False
         self.listener = None
+        self.sender_thread = None
+
+        # Set when the controller should exit; waiters wake immediately
+        self.stop_event = threading.Event()
+
+        # Serializes bus access between the sender thread and the listener (emergency stop)
+        self._bus_lock = threading.Lock()
+
+        # Queued key presses are coalesced and sent at this interval (seconds, 50 Hz)
+        self.send_interval = 0.02
 
         # Movement step size (degrees)
         self.step_size = 5.0
@@ -300,24 +600,58 @@ class KeyboardController:
             'x': ("gripper", self.gripper_step),
         }
 
+        # Flat lookup table with upper-case aliases, so a key event needs a single dict probe
+        self._actions = {
+            **{k.upper(): v for k, v in self.key_actions.items() if isinstance(k, str)},
+            **self.key_actions,
+        }
+
     def start(self):
         """Start keyboard listener"""
         self.running = True
+        self.stop_event.clear()
         self.listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
         )
         self.listener.start()
+        self.sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
+        self.sender_thread.start()
         logger.info("Keyboard controller started")
         self._print_help()
 
     def stop(self):
         """Stop keyboard listener"""
         self.running = False
+        self.stop_event.set()
         if self.listener:
             self.listener.stop()
+        if self.sender_thread and self.sender_thread is not threading.current_thread():
+            self.sender_thread.join()
         logger.info("Keyboard controller stopped")
 
+    def _drain_queue(self) -> Dict[str, float]:
+        """Pop all queued key presses and sum the deltas per motor"""
+        deltas = {}
+        while not self.key_queue.empty():
+            motor_name, delta = self.key_queue.get_nowait()
+            deltas[motor_name] = deltas.get(motor_name, 0.0) + delta
+        return deltas
+
+    def _sender_loop(self):
+        """Send coalesced key presses as one Sync Write per tick"""
+        while self.running:
+            tick = time.perf_counter()
+
+            # Drain and send under the lock so an emergency stop cannot slip in between
+            with self._bus_lock:
+                deltas = self._drain_queue()
+                if deltas:
+                    motors = self.robot.MOTORS
+                    self.robot.move_motors({name: motors[name].position + delta for name, delta in deltas.items()})
+
+            self.stop_event.wait(max(0.0, self.send_interval - (time.perf_counter() - tick)))
+
     def _on_press(self, key):
         """Handle key press events"""
         if not self.running:
@@ -327,24 +661,23 @@ class KeyboardController:
         if key == keyboard.Key.esc:
             logger.info("ESC pressed - exiting")
             self.running = False
+            self.stop_event.set()
             return False
         elif key == keyboard.Key.space:
             logger.info("SPACE pressed - emergency stop")
-            self.robot.emergency_stop()
+            with self._bus_lock:
+                # Drop pending moves so they are not sent after the stop
+                self._drain_queue()
+                self.robot.emergency_stop()
             return
 
         # Handle movement keys
-        action = None
-        if hasattr(key, 'char') and key.char:
-            action = self.key_actions.get(key.char.lower())
-        else:
-            action = self.key_actions.get(key)
+        char = getattr(key, 'char', None)
+        action = self._actions.get(char or key)
 
         if action:
-            motor_name, delta = action
-            current_pos = self.robot.MOTORS[motor_name].position
-            new_pos = current_pos + delta
-            self.robot.move_motor(motor_name, new_pos)
+            # Sent by the sender thread so key repeats do not each cost a bus round-trip
+            self.key_queue.put(action)
 
     def _on_release(self, key):
         """Handle key release events"""
@@ -373,8 +706,12 @@ def main():
     parser = argparse.ArgumentParser(description="SO101 Robot Arm Keyboard Control")
     parser.add_argument("--port", required=True, help="Serial port (e.g., /dev/ttyUSB0)")
     parser.add_argument("--baudrate", type=int, default=1000000, help="Baudrate (default: 1000000)")
+    parser.add_argument("--verbose", action="store_true", help="Log every motor command (debug output)")
     args = parser.parse_args()
 
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     robot = None
     keyboard_controller = None
 
@@ -388,14 +725,14 @@ def main():
         keyboard_controller = KeyboardController(robot)
         keyboard_controller.start()
 
-        # Main loop
-        while keyboard_controller.running:
-            time.sleep(0.1)
+        # Main loop - sleep until ESC or stop() signals exit; the timeout lets Ctrl-C through on Windows
+        while not keyboard_controller.stop_event.wait(1.0):
+            pass
 
     except KeyboardInterrupt:
         print("\nKeyboard interrupt received")
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
     finally:
         # Cleanup
         if keyboard_controller:
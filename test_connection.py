@@ -21,6 +21,8 @@ except ImportError as e:
     logger.error(f"✗ Failed to import scservo_sdk: {e}")
     sys.exit(1)
 
+from low_latency import set_low_latency
+
 def test_connection(port: str, baudrate: int = 1000000):
     """Test basic connection to SO101 robot"""
 
@@ -44,6 +46,12 @@ def test_connection(port: str, baudrate: int = 1000000):
             port_handler.closePort()
             return False
 
+        # Lower USB latency so the ping round-trips are not padded by the driver
+        if set_low_latency(port_handler):
+            logger.info("✓ Low-latency mode enabled")
+        else:
+            logger.info("Low-latency mode not available, using driver defaults")
+
         # Try to ping motor ID 1 (shoulder_pan)
         logger.info("Pinging motor ID 1...")
         model_number, result, error = packet_handler.ping(port_handler, 1)